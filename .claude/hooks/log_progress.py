@@ -11,11 +11,41 @@ import sys
 import os
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 PROGRESS_FILE = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
     ".claude",
     "session_progress.log"
 )
+PROGRESS_MAX_BYTES = 8 * 1024 * 1024
+PROGRESS_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+try:
+    os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
+except OSError:
+    pass  # Don't fail on logging errors
+
+def rotate_if_needed(fd):
+    """Move the log to PROGRESS_FILE.1 once it exceeds PROGRESS_MAX_BYTES.
+
+    Returns the fd to write to (a fresh one if the file was rotated).
+    """
+    if os.fstat(fd).st_size <= PROGRESS_MAX_BYTES:
+        return fd
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX)  # Released when fd is closed
+    try:
+        # A concurrent hook may already have rotated; only move the file we hold
+        if os.path.samestat(os.stat(PROGRESS_FILE), os.fstat(fd)):
+            os.replace(PROGRESS_FILE, PROGRESS_FILE + ".1")
+    except FileNotFoundError:
+        pass
+    os.close(fd)
+    return os.open(PROGRESS_FILE, PROGRESS_FLAGS, 0o644)
 
 def main():
     try:
@@ -32,13 +62,15 @@ def main():
         command = tool_input.get("command", "")[:100]  # First 100 chars
 
     # Log entry
-    timestamp = datetime.now().isoformat()
-    log_entry = f"[{timestamp}] {tool_name}: {command}\n"
+    log_entry = f"[{datetime.now().isoformat()}] {tool_name}: {command}\n"
 
     try:
-        os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
-        with open(PROGRESS_FILE, "a") as f:
-            f.write(log_entry)
+        # Single O_APPEND write: atomic for short lines, no TextIOWrapper setup
+        fd = rotate_if_needed(os.open(PROGRESS_FILE, PROGRESS_FLAGS, 0o644))
+        try:
+            os.write(fd, log_entry.encode("utf-8"))
+        finally:
+            os.close(fd)
     except:
         pass  # Don't fail on logging errors
 
@@ -158,6 +158,7 @@ func registerAdminClinicRoutes(admin chi.Router, cfg *Config) {
 		if cfg.ConversationHandler != nil {
 			clinicRoutes.Get("/conversations/{phone}", cfg.ConversationHandler.GetTranscript)
 			clinicRoutes.Get("/sms/{phone}", cfg.ConversationHandler.GetSMSTranscript)
+			clinicRoutes.Get("/sms/{phone}/stream", cfg.ConversationHandler.StreamSMSTranscript)
 		}
 		if cfg.AdminClinicData != nil {
 			clinicRoutes.Delete("/phones/{phone}", cfg.AdminClinicData.PurgePhone)
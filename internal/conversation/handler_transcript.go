@@ -7,6 +7,7 @@ import (
 	"net/url"
 	"strconv"
 	"strings"
+	"time"
 
 	"github.com/go-chi/chi/v5"
 )
@@ -68,40 +69,47 @@ func (h *Handler) GetTranscript(w http.ResponseWriter, r *http.Request) {
 	json.NewEncoder(w).Encode(resp)
 }
 
-// SMSTranscriptResponse is the response for GET /admin/clinics/{orgID}/sms/{phone}.
-type SMSTranscriptResponse struct {
-	ConversationID string                 `json:"conversation_id"`
-	Messages       []SMSTranscriptMessage `json:"messages"`
-}
-
-// GetSMSTranscript handles GET /admin/clinics/{orgID}/sms/{phone}.
-// Returns a Redis-backed SMS transcript that includes webhook acks, AI replies, deposit links, and confirmations.
-func (h *Handler) GetSMSTranscript(w http.ResponseWriter, r *http.Request) {
+// smsConversationID resolves the sms:{orgID}:{digits} conversation ID from the orgID and
+// phone URL params. On bad params or a missing store it writes the error response and returns false.
+func (h *Handler) smsConversationID(w http.ResponseWriter, r *http.Request) (string, bool) {
 	orgID := chi.URLParam(r, "orgID")
-	phoneParam := chi.URLParam(r, "phone")
-	phone, err := url.PathUnescape(phoneParam)
+	phone, err := url.PathUnescape(chi.URLParam(r, "phone"))
 	if err != nil {
 		http.Error(w, "invalid phone encoding", http.StatusBadRequest)
-		return
+		return "", false
 	}
 	phone = strings.TrimSpace(phone)
 
 	if orgID == "" || phone == "" {
 		http.Error(w, "missing org_id or phone", http.StatusBadRequest)
-		return
+		return "", false
 	}
 	if h.sms == nil {
 		http.Error(w, "sms transcript store not configured", http.StatusServiceUnavailable)
-		return
+		return "", false
 	}
 
 	digits := sanitizeDigits(phone)
 	if digits == "" {
 		http.Error(w, "invalid phone", http.StatusBadRequest)
+		return "", false
+	}
+	return fmt.Sprintf("sms:%s:%s", orgID, normalizeUSDigits(digits)), true
+}
+
+// SMSTranscriptResponse is the response for GET /admin/clinics/{orgID}/sms/{phone}.
+type SMSTranscriptResponse struct {
+	ConversationID string                 `json:"conversation_id"`
+	Messages       []SMSTranscriptMessage `json:"messages"`
+}
+
+// GetSMSTranscript handles GET /admin/clinics/{orgID}/sms/{phone}.
+// Returns a Redis-backed SMS transcript that includes webhook acks, AI replies, deposit links, and confirmations.
+func (h *Handler) GetSMSTranscript(w http.ResponseWriter, r *http.Request) {
+	conversationID, ok := h.smsConversationID(w, r)
+	if !ok {
 		return
 	}
-	digits = normalizeUSDigits(digits)
-	conversationID := fmt.Sprintf("sms:%s:%s", orgID, digits)
 
 	var limit int64
 	if raw := strings.TrimSpace(r.URL.Query().Get("limit")); raw != "" {
@@ -128,6 +136,73 @@ func (h *Handler) GetSMSTranscript(w http.ResponseWriter, r *http.Request) {
 	_ = json.NewEncoder(w).Encode(resp)
 }
 
+// smsStreamKeepalive is how often an idle transcript stream sends a comment line,
+// keeping proxies and client read timeouts from dropping the connection.
+const smsStreamKeepalive = 15 * time.Second
+
+// StreamSMSTranscript handles GET /admin/clinics/{orgID}/sms/{phone}/stream.
+// Streams messages appended to the SMS transcript as server-sent events, one JSON message per event.
+// Only messages appended after the stream opens are sent; clients read the transcript once after connecting.
+func (h *Handler) StreamSMSTranscript(w http.ResponseWriter, r *http.Request) {
+	conversationID, ok := h.smsConversationID(w, r)
+	if !ok {
+		return
+	}
+
+	// Streams outlive the server write timeout; keepalives bound idle connections instead.
+	// Without a clearable deadline the stream would be cut at WriteTimeout, so refuse it
+	// and let the client fall back to polling GetSMSTranscript.
+	rc := http.NewResponseController(w)
+	if err := rc.SetWriteDeadline(time.Time{}); err != nil {
+		h.logger.Error("sms transcript stream cannot clear write deadline", "error", err, "conversation_id", conversationID)
+		http.Error(w, "sms transcript streaming not supported", http.StatusInternalServerError)
+		return
+	}
+
+	events, cancel, err := h.sms.Subscribe(r.Context(), conversationID)
+	if err != nil {
+		h.logger.Error("failed to subscribe to sms transcript", "error", err, "conversation_id", conversationID)
+		http.Error(w, "failed to stream sms transcript", http.StatusInternalServerError)
+		return
+	}
+	defer cancel()
+
+	w.Header().Set("Content-Type", "text/event-stream")
+	w.Header().Set("Cache-Control", "no-cache")
+	w.Header().Set("X-Accel-Buffering", "no")
+	w.WriteHeader(http.StatusOK)
+	if err := rc.Flush(); err != nil {
+		return
+	}
+
+	keepalive := time.NewTicker(smsStreamKeepalive)
+	defer keepalive.Stop()
+	for {
+		select {
+		case <-r.Context().Done():
+			return
+		case <-keepalive.C:
+			if _, err := fmt.Fprint(w, ": keepalive\n\n"); err != nil {
+				return
+			}
+		case msg, ok := <-events:
+			if !ok {
+				return
+			}
+			data, err := json.Marshal(msg)
+			if err != nil {
+				continue
+			}
+			if _, err := fmt.Fprintf(w, "id: %s\ndata: %s\n\n", msg.ID, data); err != nil {
+				return
+			}
+		}
+		if err := rc.Flush(); err != nil {
+			return
+		}
+	}
+}
+
 // sanitizeDigits strips all non-digit characters from a phone string.
 func sanitizeDigits(value string) string {
 	value = strings.TrimSpace(value)
@@ -13,7 +13,10 @@ import (
 	"go.opentelemetry.io/otel/trace"
 )
 
-const smsTranscriptKeyPrefix = "sms_transcript:"
+const (
+	smsTranscriptKeyPrefix     = "sms_transcript:"
+	smsTranscriptChannelPrefix = "sms_transcript_events:"
+)
 
 type SMSTranscriptMessage struct {
 	ID                string            `json:"id"`
@@ -79,6 +82,7 @@ func (s *SMSTranscriptStore) Append(ctx context.Context, conversationID string,
 	if s.maxMessages > 0 {
 		pipe.LTrim(ctx, key, -s.maxMessages, -1)
 	}
+	pipe.Publish(ctx, smsTranscriptChannel(conversationID), data)
 	_, err = pipe.Exec(ctx)
 	if err != nil {
 		span.RecordError(err)
@@ -129,6 +133,41 @@ func (s *SMSTranscriptStore) List(ctx context.Context, conversationID string, li
 	return out, nil
 }
 
+// Subscribe streams messages appended to the conversation after it returns.
+// The channel closes when ctx is done or the returned cancel func is called.
+func (s *SMSTranscriptStore) Subscribe(ctx context.Context, conversationID string) (<-chan SMSTranscriptMessage, func(), error) {
+	if s == nil || s.redis == nil {
+		return nil, nil, errors.New("conversation: sms transcript store not configured")
+	}
+	if conversationID == "" {
+		return nil, nil, errors.New("conversation: sms transcript conversationID required")
+	}
+
+	sub := s.redis.Subscribe(ctx, smsTranscriptChannel(conversationID))
+	// Wait for the subscription to be confirmed so no append is missed after return.
+	if _, err := sub.Receive(ctx); err != nil {
+		_ = sub.Close()
+		return nil, nil, fmt.Errorf("conversation: subscribe sms transcript: %w", err)
+	}
+
+	out := make(chan SMSTranscriptMessage, 16)
+	go func() {
+		defer close(out)
+		for raw := range sub.Channel() {
+			var msg SMSTranscriptMessage
+			if err := json.Unmarshal([]byte(raw.Payload), &msg); err != nil {
+				continue
+			}
+			select {
+			case out <- msg:
+			case <-ctx.Done():
+				return
+			}
+		}
+	}()
+	return out, func() { _ = sub.Close() }, nil
+}
+
 // HasAssistantMessage returns true if any assistant message exists in the transcript list.
 func (s *SMSTranscriptStore) HasAssistantMessage(ctx context.Context, conversationID string) (bool, error) {
 	if s == nil || s.redis == nil {
@@ -149,3 +188,7 @@ func (s *SMSTranscriptStore) HasAssistantMessage(ctx context.Context, conversati
 func smsTranscriptKey(conversationID string) string {
 	return smsTranscriptKeyPrefix + conversationID
 }
+
+func smsTranscriptChannel(conversationID string) string {
+	return smsTranscriptChannelPrefix + conversationID
+}
@@ -0,0 +1,165 @@
+package conversation
+
+import (
+	"bufio"
+	"context"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/alicebob/miniredis/v2"
+	"github.com/go-chi/chi/v5"
+	"github.com/redis/go-redis/v9"
+	"github.com/wolfman30/medspa-ai-platform/pkg/logging"
+)
+
+func newTestSMSTranscriptStore(t *testing.T) (*SMSTranscriptStore, *redis.Client) {
+	t.Helper()
+	mr, err := miniredis.Run()
+	if err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(mr.Close)
+
+	client := redis.NewClient(&redis.Options{Addr: mr.Addr()})
+	t.Cleanup(func() { _ = client.Close() })
+	return NewSMSTranscriptStore(client), client
+}
+
+func TestSMSTranscriptStoreAppendPublishes(t *testing.T) {
+	store, client := newTestSMSTranscriptStore(t)
+	ctx := context.Background()
+	conversationID := "sms:org-1:15551234567"
+
+	sub := client.Subscribe(ctx, smsTranscriptChannel(conversationID))
+	defer sub.Close()
+	if _, err := sub.Receive(ctx); err != nil {
+		t.Fatalf("subscribe: %v", err)
+	}
+
+	if err := store.Append(ctx, conversationID, SMSTranscriptMessage{Role: "user", Body: "hi"}); err != nil {
+		t.Fatalf("append: %v", err)
+	}
+
+	select {
+	case raw := <-sub.Channel():
+		var msg SMSTranscriptMessage
+		if err := json.Unmarshal([]byte(raw.Payload), &msg); err != nil {
+			t.Fatalf("decode payload: %v", err)
+		}
+		if msg.Body != "hi" || msg.ID == "" || msg.Timestamp.IsZero() {
+			t.Fatalf("unexpected published message: %+v", msg)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("expected Append to publish on the transcript channel")
+	}
+}
+
+func TestSMSTranscriptStoreSubscribeReceivesAppend(t *testing.T) {
+	store, _ := newTestSMSTranscriptStore(t)
+	ctx := context.Background()
+	conversationID := "sms:org-1:15551234567"
+
+	events, cancel, err := store.Subscribe(ctx, conversationID)
+	if err != nil {
+		t.Fatalf("subscribe: %v", err)
+	}
+	defer cancel()
+
+	if err := store.Append(ctx, "sms:org-1:15559999999", SMSTranscriptMessage{Role: "user", Body: "other"}); err != nil {
+		t.Fatalf("append other: %v", err)
+	}
+	if err := store.Append(ctx, conversationID, SMSTranscriptMessage{Role: "assistant", Body: "hello"}); err != nil {
+		t.Fatalf("append: %v", err)
+	}
+
+	select {
+	case msg := <-events:
+		if msg.Body != "hello" || msg.Role != "assistant" {
+			t.Fatalf("unexpected event: %+v", msg)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("expected subscriber to receive the appended message")
+	}
+}
+
+func TestStreamSMSTranscriptWritesEventsUntilCancel(t *testing.T) {
+	store, _ := newTestSMSTranscriptStore(t)
+	handler := NewHandler(&stubEnqueuer{}, &stubJobStore{}, nil, nil, logging.Default())
+	handler.SetSMSTranscriptStore(store)
+
+	done := make(chan struct{})
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		defer close(done)
+		rctx := chi.NewRouteContext()
+		rctx.URLParams.Add("orgID", "org-1")
+		rctx.URLParams.Add("phone", "+15551234567")
+		handler.StreamSMSTranscript(w, r.WithContext(context.WithValue(r.Context(), chi.RouteCtxKey, rctx)))
+	}))
+	defer srv.Close()
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, srv.URL, nil)
+	if err != nil {
+		t.Fatal(err)
+	}
+	resp, err := http.DefaultClient.Do(req)
+	if err != nil {
+		t.Fatalf("open stream: %v", err)
+	}
+	defer resp.Body.Close()
+	if resp.StatusCode != http.StatusOK {
+		t.Fatalf("expected 200, got %d", resp.StatusCode)
+	}
+	if ct := resp.Header.Get("Content-Type"); ct != "text/event-stream" {
+		t.Fatalf("expected text/event-stream, got %q", ct)
+	}
+
+	// Headers are flushed after the subscription is confirmed, so this Append is delivered.
+	if err := store.Append(context.Background(), "sms:org-1:15551234567", SMSTranscriptMessage{Role: "assistant", Body: "see you then"}); err != nil {
+		t.Fatalf("append: %v", err)
+	}
+
+	lines := make(chan string)
+	go func() {
+		scanner := bufio.NewScanner(resp.Body)
+		for scanner.Scan() {
+			lines <- scanner.Text()
+		}
+		close(lines)
+	}()
+
+	var data string
+	timeout := time.After(2 * time.Second)
+	for data == "" {
+		select {
+		case line, ok := <-lines:
+			if !ok {
+				t.Fatal("stream closed before a data frame")
+			}
+			if strings.HasPrefix(line, "data: ") {
+				data = strings.TrimPrefix(line, "data: ")
+			}
+		case <-timeout:
+			t.Fatal("expected a data frame")
+		}
+	}
+	var msg SMSTranscriptMessage
+	if err := json.Unmarshal([]byte(data), &msg); err != nil {
+		t.Fatalf("decode frame: %v", err)
+	}
+	if msg.Body != "see you then" {
+		t.Fatalf("unexpected frame: %+v", msg)
+	}
+
+	cancel()
+	select {
+	case <-done:
+	case <-time.After(2 * time.Second):
+		t.Fatal("expected handler to return after the client cancelled")
+	}
+}
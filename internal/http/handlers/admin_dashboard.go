@@ -4,6 +4,7 @@ import (
 	"database/sql"
 	"encoding/json"
 	"net/http"
+	"strings"
 	"time"
 
 	"github.com/go-chi/chi/v5"
@@ -106,7 +107,8 @@ type PendingAction struct {
 }
 
 // GetDashboardOverview returns the main dashboard overview.
-// GET /admin/orgs/{orgID}/dashboard
+// GET /admin/orgs/{orgID}/dashboard?fields=leads,payments
+// When fields is set, only the listed sections are computed; the others stay zero-valued.
 func (h *AdminDashboardHandler) GetDashboardOverview(w http.ResponseWriter, r *http.Request) {
 	orgID := chi.URLParam(r, "orgID")
 	if orgID == "" {
@@ -118,6 +120,7 @@ func (h *AdminDashboardHandler) GetDashboardOverview(w http.ResponseWriter, r *h
 	if period == "" {
 		period = "week"
 	}
+	want := dashboardSections(r.URL.Query().Get("fields"))
 
 	dashboard := DashboardOverviewResponse{
 		OrgID:  orgID,
@@ -135,131 +138,162 @@ func (h *AdminDashboardHandler) GetDashboardOverview(w http.ResponseWriter, r *h
 	today := now.Truncate(24 * time.Hour)
 
 	// Lead metrics
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM leads WHERE org_id = $1`, orgID,
-	).Scan(&dashboard.Leads.Total)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM leads WHERE org_id = $1 AND created_at >= $2`, orgID, weekAgo,
-	).Scan(&dashboard.Leads.NewThisWeek)
-
-	var converted int
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(DISTINCT l.id) FROM leads l
-		 JOIN payments p ON l.id = p.lead_id
-		 WHERE l.org_id = $1 AND p.status = 'succeeded'`, orgID,
-	).Scan(&converted)
-	if dashboard.Leads.Total > 0 {
-		dashboard.Leads.ConversionRate = float64(converted) / float64(dashboard.Leads.Total) * 100
+	if want("leads") {
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM leads WHERE org_id = $1`, orgID,
+		).Scan(&dashboard.Leads.Total)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM leads WHERE org_id = $1 AND created_at >= $2`, orgID, weekAgo,
+		).Scan(&dashboard.Leads.NewThisWeek)
+
+		var converted int
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(DISTINCT l.id) FROM leads l
+			 JOIN payments p ON l.id = p.lead_id
+			 WHERE l.org_id = $1 AND p.status = 'succeeded'`, orgID,
+		).Scan(&converted)
+		if dashboard.Leads.Total > 0 {
+			dashboard.Leads.ConversionRate = float64(converted) / float64(dashboard.Leads.Total) * 100
+		}
 	}
 
 	// Conversation metrics - using conversation_jobs table
-	conversationIDPattern := "sms:" + orgID + ":%"
+	if want("conversations") {
+		conversationIDPattern := "sms:" + orgID + ":%"
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1`, conversationIDPattern,
-	).Scan(&dashboard.Conversations.UniqueConversations)
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1`, conversationIDPattern,
+		).Scan(&dashboard.Conversations.UniqueConversations)
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM conversation_jobs WHERE conversation_id LIKE $1`, conversationIDPattern,
-	).Scan(&dashboard.Conversations.TotalJobs)
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM conversation_jobs WHERE conversation_id LIKE $1`, conversationIDPattern,
+		).Scan(&dashboard.Conversations.TotalJobs)
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1 AND created_at >= $2`, conversationIDPattern, today,
-	).Scan(&dashboard.Conversations.Today)
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1 AND created_at >= $2`, conversationIDPattern, today,
+		).Scan(&dashboard.Conversations.Today)
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1 AND created_at >= $2`, conversationIDPattern, weekAgo,
-	).Scan(&dashboard.Conversations.ThisWeek)
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(DISTINCT conversation_id) FROM conversation_jobs WHERE conversation_id LIKE $1 AND created_at >= $2`, conversationIDPattern, weekAgo,
+		).Scan(&dashboard.Conversations.ThisWeek)
+	}
 
 	// Payment metrics
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'succeeded'`, orgID,
-	).Scan(&dashboard.Payments.TotalCollected)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'succeeded' AND created_at >= $2`, orgID, weekAgo,
-	).Scan(&dashboard.Payments.ThisWeek)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM payments WHERE org_id = $1 AND status = 'pending'`, orgID,
-	).Scan(&dashboard.Payments.PendingDeposits)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'refunded'`, orgID,
-	).Scan(&dashboard.Payments.RefundedAmount)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM payment_disputes WHERE org_id = $1 AND state NOT IN ('WON', 'LOST', 'ACCEPTED')`, orgID,
-	).Scan(&dashboard.Payments.DisputeCount)
+	if want("payments") {
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'succeeded'`, orgID,
+		).Scan(&dashboard.Payments.TotalCollected)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'succeeded' AND created_at >= $2`, orgID, weekAgo,
+		).Scan(&dashboard.Payments.ThisWeek)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM payments WHERE org_id = $1 AND status = 'pending'`, orgID,
+		).Scan(&dashboard.Payments.PendingDeposits)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COALESCE(SUM(amount_cents), 0) FROM payments WHERE org_id = $1 AND status = 'refunded'`, orgID,
+		).Scan(&dashboard.Payments.RefundedAmount)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM payment_disputes WHERE org_id = $1 AND state NOT IN ('WON', 'LOST', 'ACCEPTED')`, orgID,
+		).Scan(&dashboard.Payments.DisputeCount)
+	}
 
 	// Booking metrics
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM bookings WHERE org_id = $1`, orgID,
-	).Scan(&dashboard.Bookings.Total)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND scheduled_at > $2`, orgID, now,
-	).Scan(&dashboard.Bookings.Upcoming)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND scheduled_at >= $2 AND scheduled_at < $3`, orgID, weekAgo, now,
-	).Scan(&dashboard.Bookings.ThisWeek)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND status = 'cancelled'`, orgID,
-	).Scan(&dashboard.Bookings.CancelledCount)
+	if want("bookings") {
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM bookings WHERE org_id = $1`, orgID,
+		).Scan(&dashboard.Bookings.Total)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND scheduled_at > $2`, orgID, now,
+		).Scan(&dashboard.Bookings.Upcoming)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND scheduled_at >= $2 AND scheduled_at < $3`, orgID, weekAgo, now,
+		).Scan(&dashboard.Bookings.ThisWeek)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM bookings WHERE org_id = $1 AND status = 'cancelled'`, orgID,
+		).Scan(&dashboard.Bookings.CancelledCount)
+	}
 
 	// Compliance metrics
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND created_at >= $2`, orgID, today,
-	).Scan(&dashboard.Compliance.AuditEventsToday)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.supervisor_review' AND created_at >= $2`, orgID, weekAgo,
-	).Scan(&dashboard.Compliance.SupervisorInterventions)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.phi_detected' AND created_at >= $2`, orgID, weekAgo,
-	).Scan(&dashboard.Compliance.PHIDetections)
-
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.disclaimer_sent' AND created_at >= $2`, orgID, weekAgo,
-	).Scan(&dashboard.Compliance.DisclaimersSent)
+	if want("compliance") {
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND created_at >= $2`, orgID, today,
+		).Scan(&dashboard.Compliance.AuditEventsToday)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.supervisor_review' AND created_at >= $2`, orgID, weekAgo,
+		).Scan(&dashboard.Compliance.SupervisorInterventions)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.phi_detected' AND created_at >= $2`, orgID, weekAgo,
+		).Scan(&dashboard.Compliance.PHIDetections)
+
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COUNT(*) FROM compliance_audit_events WHERE org_id = $1 AND event_type = 'compliance.disclaimer_sent' AND created_at >= $2`, orgID, weekAgo,
+		).Scan(&dashboard.Compliance.DisclaimersSent)
+	}
 
 	// Onboarding status
-	var brandStatus, campaignStatus sql.NullString
-	h.db.QueryRowContext(r.Context(),
-		`SELECT status FROM ten_dlc_brands WHERE org_id = $1 ORDER BY created_at DESC LIMIT 1`, orgID,
-	).Scan(&brandStatus)
-	dashboard.Onboarding.BrandStatus = brandStatus.String
-	if dashboard.Onboarding.BrandStatus == "" {
-		dashboard.Onboarding.BrandStatus = "NOT_REGISTERED"
-	}
+	if want("onboarding") {
+		var brandStatus, campaignStatus sql.NullString
+		h.db.QueryRowContext(r.Context(),
+			`SELECT status FROM ten_dlc_brands WHERE org_id = $1 ORDER BY created_at DESC LIMIT 1`, orgID,
+		).Scan(&brandStatus)
+		dashboard.Onboarding.BrandStatus = brandStatus.String
+		if dashboard.Onboarding.BrandStatus == "" {
+			dashboard.Onboarding.BrandStatus = "NOT_REGISTERED"
+		}
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT status FROM ten_dlc_campaigns WHERE org_id = $1 ORDER BY created_at DESC LIMIT 1`, orgID,
-	).Scan(&campaignStatus)
-	dashboard.Onboarding.CampaignStatus = campaignStatus.String
-	if dashboard.Onboarding.CampaignStatus == "" {
-		dashboard.Onboarding.CampaignStatus = "NOT_REGISTERED"
-	}
+		h.db.QueryRowContext(r.Context(),
+			`SELECT status FROM ten_dlc_campaigns WHERE org_id = $1 ORDER BY created_at DESC LIMIT 1`, orgID,
+		).Scan(&campaignStatus)
+		dashboard.Onboarding.CampaignStatus = campaignStatus.String
+		if dashboard.Onboarding.CampaignStatus == "" {
+			dashboard.Onboarding.CampaignStatus = "NOT_REGISTERED"
+		}
 
-	h.db.QueryRowContext(r.Context(),
-		`SELECT COALESCE(SUM(numbers_assigned), 0) FROM ten_dlc_campaigns WHERE org_id = $1 AND status = 'ACTIVE'`, orgID,
-	).Scan(&dashboard.Onboarding.NumbersActive)
+		h.db.QueryRowContext(r.Context(),
+			`SELECT COALESCE(SUM(numbers_assigned), 0) FROM ten_dlc_campaigns WHERE org_id = $1 AND status = 'ACTIVE'`, orgID,
+		).Scan(&dashboard.Onboarding.NumbersActive)
 
-	dashboard.Onboarding.FullyCompliant = dashboard.Onboarding.BrandStatus == "VERIFIED" &&
-		dashboard.Onboarding.CampaignStatus == "ACTIVE" &&
-		dashboard.Onboarding.NumbersActive > 0
+		dashboard.Onboarding.FullyCompliant = dashboard.Onboarding.BrandStatus == "VERIFIED" &&
+			dashboard.Onboarding.CampaignStatus == "ACTIVE" &&
+			dashboard.Onboarding.NumbersActive > 0
+	}
 
 	// Pending actions
-	dashboard.PendingActions = h.getPendingActions(r, orgID)
+	if want("pending_actions") {
+		dashboard.PendingActions = h.getPendingActions(r, orgID)
+	}
 
 	w.Header().Set("Content-Type", "application/json")
 	json.NewEncoder(w).Encode(dashboard)
 }
 
+// dashboardSections parses the fields query parameter into a section filter.
+// Entries may name a section ("leads") or a field within one ("leads.conversion_rate").
+// An empty parameter selects every section.
+func dashboardSections(fields string) func(string) bool {
+	if strings.TrimSpace(fields) == "" {
+		return func(string) bool { return true }
+	}
+	selected := make(map[string]bool)
+	for _, field := range strings.Split(fields, ",") {
+		section, _, _ := strings.Cut(strings.TrimSpace(field), ".")
+		if section != "" {
+			selected[section] = true
+		}
+	}
+	return func(section string) bool { return selected[section] }
+}
+
 func (h *AdminDashboardHandler) getPendingActions(r *http.Request, orgID string) []PendingAction {
 	var actions []PendingAction
 
@@ -182,3 +182,18 @@ func TestListOrganizations_CreatedAtFormat(t *testing.T) {
 	err = mock.ExpectationsWereMet()
 	assert.NoError(t, err)
 }
+
+func TestDashboardSections(t *testing.T) {
+	all := dashboardSections("")
+	assert.True(t, all("leads"))
+	assert.True(t, all("pending_actions"))
+
+	want := dashboardSections("leads.conversion_rate, conversations.unique_conversations,payments")
+	assert.True(t, want("leads"))
+	assert.True(t, want("conversations"))
+	assert.True(t, want("payments"))
+	assert.False(t, want("bookings"))
+	assert.False(t, want("compliance"))
+	assert.False(t, want("onboarding"))
+	assert.False(t, want("pending_actions"))
+}
@@ -0,0 +1,89 @@
+"""Shared HTTP session for the dev admin API scripts.
+
+One keep-alive session per process, so a script pays for a single TLS
+handshake however many admin endpoints it calls.
+"""
+
+import json
+import sys
+
+try:
+    import requests
+    import urllib3
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    print("ERROR: 'requests' module required. Install with: pip install requests")
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:  # optional: faster response decoding
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# TLS policy for the dev API, defined here only: certificates are not verified,
+# matching the CERT_NONE urllib contexts these scripts used before sharing a session.
+# Scripts that talk to the dev API go through SESSION rather than their own contexts.
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+SESSION = requests.Session()
+SESSION.verify = False
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+def api_request(url: str, token: str, method: str = "GET", data: dict = None, max_bytes: int = None):
+    """Make an API request. Returns (payload, status); status is 0 if no response arrived.
+
+    With max_bytes, at most that much of the body is read; larger bodies come
+    back as {"truncated": True, "preview": text} instead of being decoded.
+    Non-JSON responses (e.g. an HTML page from a misrouted proxy) come back as
+    {"raw": text, "ct": content_type} without a parse attempt.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        with SESSION.request(method, url, json=data, headers=headers, timeout=30, stream=True) as response:
+            status = response.status_code
+            content_type = response.headers.get("Content-Type", "")
+            if max_bytes is None:
+                body = response.content
+            else:
+                body = response.raw.read(max_bytes + 1, decode_content=True)
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        return {"error": str(e)}, 0
+    if status >= 400:
+        return {"error": f"HTTP {status}: {body[:500].decode(errors='replace')}"}, status
+    if not content_type.startswith("application/json"):
+        return {"raw": body[:500].decode(errors="replace"), "ct": content_type}, status
+    if max_bytes is not None and len(body) > max_bytes:
+        return {"truncated": True, "preview": body[:max_bytes].decode(errors="replace")}, status
+    try:
+        return _loads(body), status
+    except ValueError as e:
+        return {"error": str(e)}, 0
+
+
+_PREVIEW_ENCODER = json.JSONEncoder()
+
+
+def preview(obj, n: int = 500) -> str:
+    """Render a response for printing, at most ~n chars (n=None for all of it).
+
+    Responses whose indented form fits are pretty-printed; others use the
+    compact form, cut at n, rather than indenting the whole thing to slice it.
+    """
+    if n is None:
+        return json.dumps(obj, indent=2)
+    # Encode incrementally and stop once past n; big responses are never serialized in full
+    size = 0
+    chunks = []
+    for chunk in _PREVIEW_ENCODER.iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > n:
+            return "".join(chunks)[:n] + "...[truncated]"
+    # Indenting can push a compact fit past n; fall back to the compact form then
+    pretty = json.dumps(obj, indent=2)
+    return pretty if len(pretty) <= n else "".join(chunks)
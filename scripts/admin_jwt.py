@@ -0,0 +1,90 @@
+"""Admin JWTs for the dev helper scripts, cached on disk between runs.
+
+Scripts call get_admin_jwt(secret) instead of signing a token every run.
+Tokens are cached per secret (keyed by a hash, never the secret itself),
+so scripts pointed at different environments never share a token.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: faster token serialization
+    orjson = None
+
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "medspa"
+REFRESH_MARGIN_SECONDS = 60
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# The header never changes; encode it once at import
+_HEADER_B64 = _b64url(_dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def create_jwt(secret: str, ttl: int = 3600, *, now: int = None) -> str:
+    """Sign a fresh HS256 admin token valid for `ttl` seconds."""
+    if now is None:
+        now = int(time.time())
+    payload = {"sub": "admin", "iat": now, "exp": now + ttl}
+    # Build the signing input as bytes; no str round-trip before the HMAC
+    message = _HEADER_B64 + b"." + _b64url(_dumps(payload))
+    signature = hmac.new(secret.encode(), message, hashlib.sha256).digest()
+    return (message + b"." + _b64url(signature)).decode()
+
+
+def write_private_json(path: Path, obj) -> None:
+    """Atomically write `obj` as JSON readable only by the current user.
+
+    Best effort: a read-only or missing home directory just means no caching.
+    mkstemp creates the file 0600; os.replace swaps it in atomically.
+    """
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(obj, f)
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _cache_path(secret: str, ttl: int) -> Path:
+    key = hashlib.sha256(secret.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"admin_jwt_{key}_{ttl}.json"
+
+
+def get_admin_jwt(secret: str, ttl: int = 3600) -> str:
+    """Return a cached admin token for `secret`, re-signing shortly before expiry."""
+    path = _cache_path(secret, ttl)
+    now = int(time.time())
+    try:
+        cached = json.loads(path.read_text())
+        if cached["exp"] - now > REFRESH_MARGIN_SECONDS:
+            return cached["token"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    token = create_jwt(secret, ttl, now=now)
+    write_private_json(path, {"exp": now + ttl, "token": token})
+    return token
@@ -19,26 +19,37 @@ Environment Variables:
     API_URL - API endpoint (default: https://api-dev.aiwolfsolutions.com)
     ADMIN_JWT_SECRET - Admin JWT secret for authentication
     TEST_ORG_ID - Organization ID (default: test org)
+    DEMO_POLL_MIN / DEMO_POLL_MAX / DEMO_POLL_BACKOFF - Transcript poll interval
+        bounds (seconds) and idle backoff factor (default: 0.2 / 3.0 / 1.6)
 """
 
 from __future__ import annotations
 
 import argparse
 import base64
+import contextlib
+import functools
 import hashlib
 import hmac
 import json
 import os
+import queue
+import random
 import re
 import sys
+import threading
 import time
-import traceback
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # optional: faster decode for transcript polls
+    orjson = None
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_PROJECT_ROOT / "scripts"))
 
@@ -47,35 +58,104 @@ CLINIC_NAME = "Brilliant Aesthetics"
 CLINIC_PHONE = os.getenv("TEST_CLINIC_PHONE", "+14407325929")
 CLINIC_AVATAR = "✨"
 
-# Timing settings (can be adjusted via env vars)
+# URL-quoted once; these go into every phone simulator URL
+_CLINIC_NAME_Q = quote(CLINIC_NAME)
+_CLINIC_PHONE_Q = quote(CLINIC_PHONE, safe="")
+
+# Timing settings (can be adjusted via env vars; read once per process)
+@functools.lru_cache(maxsize=1)
 def message_delay() -> float:
     return float(os.getenv("DEMO_MESSAGE_DELAY", "2.5"))
 
+@functools.lru_cache(maxsize=1)
 def reading_delay() -> float:
     return float(os.getenv("DEMO_READING_DELAY", "3.0"))
 
+@functools.lru_cache(maxsize=1)
 def ai_wait_timeout() -> float:
     return float(os.getenv("DEMO_AI_WAIT_TIMEOUT", "120"))
 
+@functools.lru_cache(maxsize=1)
 def http_timeout() -> float:
     return float(os.getenv("E2E_HTTP_TIMEOUT", "20"))
 
+# Per-browser launch timeout, so a missing Edge fails fast instead of after Playwright's 30s default
+@functools.lru_cache(maxsize=1)
+def launch_timeout_ms() -> float:
+    return float(os.getenv("DEMO_LAUNCH_TIMEOUT_MS", "10000"))
+
+# Launch attempts per browser; a timed-out launch is retried with a doubled timeout
+LAUNCH_ATTEMPTS = 3
+
+# Messages fetched per poll; new replies always land at the tail of the transcript
+POLL_TAIL_LIMIT = 50
+
+# Read timeout for the transcript event stream; the server sends keepalives every 15s
+SSE_READ_TIMEOUT = 20.0
+
+# Consecutive failed stream attempts (non-200 or transport errors) before waits stop trying it
+SSE_MAX_FAILURES = 2
+
+# Dashboard fields shown in the metrics overlay (section.key)
+DASHBOARD_FIELDS = (
+    "leads.conversion_rate",
+    "conversations.unique_conversations",
+    "payments.total_collected_cents",
+)
+
+# How often the page refreshes the metrics overlay on its own
+OVERLAY_REFRESH_MS = 2000
+
+# Transcript polling: start fast, back off while idle, reset on new messages
+@functools.lru_cache(maxsize=1)
+def poll_min_interval() -> float:
+    return float(os.getenv("DEMO_POLL_MIN", "0.2"))
+
+@functools.lru_cache(maxsize=1)
+def poll_max_interval() -> float:
+    return float(os.getenv("DEMO_POLL_MAX", "3.0"))
+
+@functools.lru_cache(maxsize=1)
+def poll_backoff() -> float:
+    return float(os.getenv("DEMO_POLL_BACKOFF", "1.6"))
+
 
-def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps_compact = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# (secret, ttl_seconds) -> (token, exp); tokens are reused until close to expiry
+_JWT_CACHE: Dict[Tuple[str, int], Tuple[str, int]] = {}
+_JWT_REFRESH_MARGIN_SECONDS = 60
+_JWT_HEADER_B64 = _b64url(_json_dumps_compact({"alg": "HS256", "typ": "JWT"}))
 
 
 def make_admin_jwt(secret: str, *, ttl_seconds: int = 30 * 60) -> str:
     now = int(time.time())
-    header = {"alg": "HS256", "typ": "JWT"}
+    key = (secret, int(ttl_seconds))
+    cached = _JWT_CACHE.get(key)
+    if cached and cached[1] - now > _JWT_REFRESH_MARGIN_SECONDS:
+        return cached[0]
     payload = {"iat": now, "exp": now + int(ttl_seconds), "role": "admin"}
-    header_b64 = _b64url(json.dumps(header, separators=(",", ":")).encode("utf-8"))
-    payload_b64 = _b64url(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
-    signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+    payload_b64 = _b64url(_json_dumps_compact(payload))
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
     sig = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
-    return f"{header_b64}.{payload_b64}.{_b64url(sig)}"
+    token = (signing_input + b"." + _b64url(sig)).decode("ascii")
+    _JWT_CACHE[key] = (token, payload["exp"])
+    return token
 
 
+@functools.lru_cache(maxsize=None)
 def require_env(name: str) -> str:
     value = (os.getenv(name) or "").strip()
     if not value:
@@ -91,7 +171,7 @@ def now_run_id() -> str:
     return time.strftime("%Y%m%d_%H%M%S")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptMessage:
     id: str
     role: str
@@ -107,30 +187,170 @@ def _parse_transcript_messages(payload: Dict[str, Any]) -> List[TranscriptMessag
     for m in raw:
         if not isinstance(m, dict):
             continue
+        # Positional args in field order: id, role, body, kind, timestamp, metadata
         out.append(
             TranscriptMessage(
-                id=str(m.get("id") or ""),
-                role=str(m.get("role") or ""),
-                body=str(m.get("body") or ""),
-                kind=str(m.get("kind") or ""),
-                timestamp=str(m.get("timestamp") or ""),
-                metadata=m.get("metadata") or {},
+                str(m.get("id") or ""),
+                str(m.get("role") or ""),
+                str(m.get("body") or ""),
+                str(m.get("kind") or ""),
+                str(m.get("timestamp") or ""),
+                m.get("metadata") or {},
             )
         )
     return out
 
 
+def _first_new_match(
+    msgs: List[TranscriptMessage], since: set, *, kind: Optional[str], role: str
+) -> Optional[TranscriptMessage]:
+    """Return the oldest message newer than `since` matching role/kind.
+
+    Transcripts are chronological, so the scan walks back from the tail and stops
+    at the first already-seen id. Non-matching new messages are added to `since`
+    so the next scan stops before them.
+    """
+    candidate = None
+    for m in reversed(msgs):
+        if not m.id:
+            continue
+        if m.id in since:
+            break
+        if (role and m.role != role) or (kind and m.kind != kind):
+            since.add(m.id)
+            continue
+        candidate = m
+    return candidate
+
+
+class LatestValuePoller(threading.Thread):
+    """Background poller that publishes its latest fetch result to waiting consumers.
+
+    Polls fast after a change and backs off while the value is unchanged, so one
+    thread can feed any number of waiters without multiplying API requests.
+    """
+
+    def __init__(self, name: str, fetch, *, min_interval: float, max_interval: float, backoff: float):
+        super().__init__(name=name, daemon=True)
+        self._fetch = fetch
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._pauses = 0
+        self.latest: Any = None
+
+    def run(self) -> None:
+        interval = self._min_interval
+        while not self._stop_event.is_set():
+            with self._cond:
+                self._cond.wait_for(lambda: self._pauses == 0 or self._stop_event.is_set())
+            if self._stop_event.is_set():
+                break
+            changed = False
+            try:
+                value = self._fetch()
+            except Exception:
+                pass  # Keep the last good value and retry after backing off
+            else:
+                with self._cond:
+                    changed = value is not self.latest and value != self.latest
+                    if changed:
+                        self.latest = value
+                        self._cond.notify_all()
+            interval = self._min_interval if changed else min(interval * self._backoff, self._max_interval)
+            self._stop_event.wait(interval)
+
+    def wait_for(self, predicate, timeout: float) -> bool:
+        """Block until predicate(latest) is true or timeout elapses."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.latest is not None and predicate(self.latest), timeout)
+
+    @contextlib.contextmanager
+    def paused(self):
+        """Suspend fetching while another source (e.g. the event stream) is being watched."""
+        with self._cond:
+            self._pauses += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._pauses -= 1
+                self._cond.notify_all()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        self.join(timeout=http_timeout())
+
+
+def _pump_lines(resp, out: queue.Queue) -> None:
+    """Copy non-empty stream lines into out, then None at the end (or the read error)."""
+    try:
+        for line in resp.iter_lines(decode_unicode=True):
+            if line:
+                out.put(line)
+    except Exception as e:  # Includes reads cut short by resp.close() once the wait is over
+        out.put(e)
+        return
+    out.put(None)
+
+
 class BrilliantDemo:
-    """Runs the Brilliant Aesthetics demo with enhanced phone simulator."""
+    """Runs the Brilliant Aesthetics demo with enhanced phone simulator.
+
+    Message waits use the transcript event stream when the API serves one.
+    Use as a context manager to run a background poller for the customer
+    transcript; otherwise waits poll on demand.
+    """
 
     def __init__(self, api_url: str, token: str, artifacts_dir: Path):
         self.api_url = api_url.rstrip("/")
         self.token = token
+        self._admin_headers: Dict[str, str] = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
         self.artifacts_dir = artifacts_dir
         self.org_id = os.getenv("TEST_ORG_ID", "bb507f20-7fcc-4941-9eac-9ed93b7834ed")
         self.clinic_phone = CLINIC_PHONE
         self.customer_phone = os.getenv("DEMO_PHONE", "+15550002001")
+        # Per-run URL prefixes, so polls don't re-quote the org and phone each time
+        org_q = quote(self.org_id)
+        self._clinic_url = f"{self.api_url}/admin/clinics/{org_q}"
+        fields_q = quote(",".join(DASHBOARD_FIELDS), safe=",.")
+        self.dashboard_url = f"{self.api_url}/admin/orgs/{org_q}/dashboard?fields={fields_q}"
+        self._phone_q: Dict[str, str] = {}
         self._requests = None
+        self._session = None
+        self._base = None
+        self._poll_lock = threading.Lock()
+        self._last_poll: Dict[str, Tuple[float, List[TranscriptMessage]]] = {}
+        self._transcript_cache: Dict[str, Tuple[str, bytes, str, List[TranscriptMessage]]] = {}
+        self._transcript_pollers: Dict[str, LatestValuePoller] = {}
+        self.seen: set = set()
+        self._stream_unavailable = False
+        self._stream_failures = 0
+
+    def __enter__(self) -> "BrilliantDemo":
+        phone = self.customer_phone
+        self._transcript_pollers[phone] = LatestValuePoller(
+            f"transcript-{phone}",
+            lambda: self.get_transcript(phone, limit=POLL_TAIL_LIMIT)[1],
+            min_interval=poll_min_interval(),
+            max_interval=poll_max_interval(),
+            backoff=poll_backoff(),
+        )
+        for poller in self._transcript_pollers.values():
+            poller.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for poller in self._transcript_pollers.values():
+            poller.stop()
+        self._transcript_pollers.clear()
 
     @property
     def requests(self):
@@ -139,33 +359,94 @@ class BrilliantDemo:
             self._requests = requests
         return self._requests
 
-    def admin_headers(self) -> Dict[str, str]:
-        return {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
+    @property
+    def base(self):
+        """The e2e_full_flow module (webhook senders, psql helpers), imported once."""
+        if self._base is None:
+            import e2e_full_flow
+            self._base = e2e_full_flow
+        return self._base
+
+    @property
+    def session(self):
+        """Keep-alive session for admin API calls (one TLS handshake per run)."""
+        if self._session is None:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = self.requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self.admin_headers())
+            self._session = session
+        return self._session
 
-    def get_transcript(self, phone: str) -> Tuple[str, List[TranscriptMessage]]:
-        url = f"{self.api_url}/admin/clinics/{quote(self.org_id)}/sms/{quote(phone, safe='')}" + "?limit=500"
-        resp = self.requests.get(url, headers=self.admin_headers(), timeout=http_timeout())
+    def admin_headers(self) -> Dict[str, str]:
+        return self._admin_headers
+
+    def _sms_url(self, phone: str) -> str:
+        phone_q = self._phone_q.get(phone)
+        if phone_q is None:
+            phone_q = self._phone_q[phone] = quote(phone, safe="")
+        return f"{self._clinic_url}/sms/{phone_q}"
+
+    def get_transcript(self, phone: str, *, limit: int = 500) -> Tuple[str, List[TranscriptMessage]]:
+        # limit returns the newest N messages (Redis LRANGE tail), so small limits suit polling
+        url = f"{self._sms_url(phone)}?limit={int(limit)}"
+        # (etag, body digest, conversation_id, messages) from the last 200 for this URL
+        cached = self._transcript_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        resp = self.session.get(url, headers=headers, timeout=http_timeout())
+        if resp.status_code == 304 and cached:
+            return cached[2], cached[3]
         if resp.status_code != 200:
             raise RuntimeError(f"GET {url} failed: {resp.status_code} {resp.text[:300]}")
-        data = resp.json() or {}
+        # Without ETag support, skip the JSON decode + parse when the body is unchanged
+        digest = hashlib.blake2b(resp.content, digest_size=16).digest()
+        if cached and cached[1] == digest:
+            return cached[2], cached[3]
+        data = _json_loads(resp.content) or {}
         conversation_id = str(data.get("conversation_id") or "")
-        return conversation_id, _parse_transcript_messages(data)
+        messages = _parse_transcript_messages(data)
+        self._transcript_cache[url] = (resp.headers.get("ETag", ""), digest, conversation_id, messages)
+        return conversation_id, messages
+
+    def mark_seen(self, phone: str) -> None:
+        """Add every current transcript message id to the rolling `seen` frontier.
+
+        wait_for_message() defaults to waiting for messages newer than this frontier.
+        """
+        _, msgs = self.get_transcript(phone)
+        self.seen.update(m.id for m in msgs if m.id)
 
     def purge_phone(self, phone: str) -> None:
-        url = f"{self.api_url}/admin/clinics/{quote(self.org_id)}/phones/{quote(phone, safe='')}"
-        resp = self.requests.delete(url, headers=self.admin_headers(), timeout=http_timeout())
+        url = f"{self._clinic_url}/phones/{quote(phone, safe='')}"
+        resp = self.session.delete(url, timeout=http_timeout())
         if resp.status_code not in (200, 204, 404):
             print(f"Warning: purge {phone} returned {resp.status_code}")
 
     def get_dashboard_metrics(self) -> Dict[str, Any]:
-        url = f"{self.api_url}/admin/orgs/{quote(self.org_id)}/dashboard"
-        resp = self.requests.get(url, headers=self.admin_headers(), timeout=http_timeout())
+        resp = self.session.get(self.dashboard_url, timeout=http_timeout())
         if resp.status_code != 200:
             return {"leads": {}, "conversations": {}, "payments": {}}
-        return resp.json() or {}
+        # Servers without field projection return the full overview; keep only what the overlay reads.
+        payload = resp.json() or {}
+        metrics: Dict[str, Any] = {}
+        for field in DASHBOARD_FIELDS:
+            section, key = field.split(".", 1)
+            value = (payload.get(section) or {}).get(key)
+            metrics.setdefault(section, {})
+            if value is not None:
+                metrics[section][key] = value
+        return metrics
 
     def send_telnyx_voice_webhook(self, phone: str, *, hangup_cause: str = "no_answer") -> bool:
-        import e2e_full_flow as base
+        base = self.base
         return base.send_telnyx_voice_webhook(
             hangup_cause,
             from_phone=phone,
@@ -173,7 +454,7 @@ class BrilliantDemo:
         )
 
     def send_telnyx_sms_webhook(self, phone: str, message: str) -> bool:
-        import e2e_full_flow as base
+        base = self.base
         return base.send_telnyx_sms_webhook(
             message,
             from_phone=phone,
@@ -181,35 +462,140 @@ class BrilliantDemo:
         )
 
     def send_square_payment_webhook(self, lead_id: str, payment_id: str, amount_cents: int) -> bool:
-        import e2e_full_flow as base
+        base = self.base
         return base.send_square_payment_webhook(lead_id, payment_id, amount_cents)
 
+    def _poll_tail(self, phone: str) -> List[TranscriptMessage]:
+        """Fetch the transcript tail, sharing one fetch between concurrent waiters."""
+        with self._poll_lock:
+            fetched_at, msgs = self._last_poll.get(phone, (0.0, None))
+            if msgs is None or time.monotonic() - fetched_at >= poll_min_interval():
+                _, msgs = self.get_transcript(phone, limit=POLL_TAIL_LIMIT)
+                self._last_poll[phone] = (time.monotonic(), msgs)
+            return msgs
+
+    def _wait_for_message_sse(
+        self, phone: str, since: set, *, kind: Optional[str], role: str, timeout_s: float
+    ) -> Tuple[bool, Optional[TranscriptMessage]]:
+        """Wait on the transcript event stream.
+
+        Returns (handled, message). handled is False when the stream is missing or
+        drops early; the caller then polls for whatever time is left. A 404, or
+        SSE_MAX_FAILURES failed attempts in a row, turns the stream off for the run.
+        """
+        if self._stream_unavailable:
+            return False, None
+        url = f"{self._sms_url(phone)}/stream"
+        deadline = time.monotonic() + timeout_s
+        resp = None
+        try:
+            resp = self.session.get(
+                url,
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+                timeout=(http_timeout(), SSE_READ_TIMEOUT),
+            )
+            if resp.status_code == 404:
+                # Older API without the stream route; poll from now on
+                self._stream_unavailable = True
+                return False, None
+            if resp.status_code != 200:
+                self._record_stream_failure()
+                return False, None
+            self._stream_failures = 0
+            # Events only cover appends after subscribing; catch anything that landed before
+            _, msgs = self.get_transcript(phone, limit=POLL_TAIL_LIMIT)
+            m = _first_new_match(msgs, since, kind=kind, role=role)
+            if m is not None:
+                return True, m
+            # Reads block until the next line or keepalive, so they run on a reader thread
+            # and this wait blocks on the queue for exactly the time left before the deadline
+            lines: queue.Queue = queue.Queue()
+            threading.Thread(target=_pump_lines, args=(resp, lines), daemon=True).start()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True, None
+                try:
+                    line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    return True, None
+                if isinstance(line, Exception):
+                    # Dropped or timed out between keepalives; poll for the time left
+                    self._record_stream_failure()
+                    return False, None
+                if line is None:
+                    break  # Stream ended before the deadline
+                if line.startswith("data:"):
+                    event = _parse_transcript_messages({"messages": [_json_loads(line[5:])]})
+                    m = _first_new_match(event, since, kind=kind, role=role)
+                    if m is not None:
+                        return True, m
+        except (self.requests.RequestException, ValueError):
+            if time.monotonic() < deadline:
+                self._record_stream_failure()
+        finally:
+            if resp is not None:
+                resp.close()
+        return time.monotonic() >= deadline, None
+
+    def _record_stream_failure(self) -> None:
+        self._stream_failures += 1
+        if self._stream_failures >= SSE_MAX_FAILURES:
+            self._stream_unavailable = True
+
     def wait_for_message(
         self,
         phone: str,
         *,
-        since_ids: List[str],
+        since_ids: Optional[Iterable[str]] = None,
         kind: Optional[str] = None,
         role: str = "assistant",
         timeout_s: float = 60.0,
     ) -> Optional[TranscriptMessage]:
+        # Private copy: non-matching new messages get added while scanning
+        since = set(self.seen if since_ids is None else since_ids)
+        started = time.monotonic()
+        poller = self._transcript_pollers.get(phone)
+        # The stream replaces polling while it is up; the poller resumes if it drops
+        with poller.paused() if poller is not None else contextlib.nullcontext():
+            handled, m = self._wait_for_message_sse(phone, since, kind=kind, role=role, timeout_s=timeout_s)
+        if handled:
+            return m
+        timeout_s = max(0.0, timeout_s - (time.monotonic() - started))
+
+        if poller is not None:
+            found: List[TranscriptMessage] = []
+
+            def matched(msgs: List[TranscriptMessage]) -> bool:
+                m = _first_new_match(msgs, since, kind=kind, role=role)
+                if m is not None:
+                    found.append(m)
+                return m is not None
+
+            poller.wait_for(matched, timeout_s)
+            return found[0] if found else None
+
         deadline = time.time() + timeout_s
-        since = set(since_ids)
+        interval = poll_min_interval()
+        max_interval = poll_max_interval()
+        backoff = poll_backoff()
         while time.time() < deadline:
-            _, msgs = self.get_transcript(phone)
-            for m in msgs:
-                if m.id and m.id in since:
-                    continue
-                if role and m.role != role:
-                    continue
-                if kind and m.kind != kind:
-                    continue
+            msgs = self._poll_tail(phone)
+            seen_before = len(since)
+            m = _first_new_match(msgs, since, kind=kind, role=role)
+            if m is not None:
                 return m
-            time.sleep(0.6)
+            if len(since) > seen_before:
+                # Something arrived (just not what we want) - the reply is likely close
+                interval = poll_min_interval()
+            else:
+                interval = min(interval * backoff, max_interval)
+            time.sleep(min(interval, max(0.0, deadline - time.time())))
         return None
 
     def get_recent_pending_payment(self) -> Optional[Tuple[str, str]]:
-        import e2e_full_flow as base
+        base = self.base
         try:
             sql = f"SELECT lead_id, id FROM payments WHERE org_id = '{self.org_id}' AND status = 'deposit_pending' ORDER BY created_at DESC LIMIT 1;"
             result = base.run_psql(sql, tuples_only=True, timeout=10)
@@ -326,6 +712,55 @@ CHECKOUT_HTML = """
 </html>
 """
 
+# Deposit-link detection in transcript bodies
+_URL_RE = re.compile(r"https?://\S+")
+_SQUARE_CHECKOUT_RE = re.compile(r"checkout\.square", re.IGNORECASE)
+
+# Encoded once at import; the demo opens it via window.openBrowser()
+_CHECKOUT_DATA_URI = "data:text/html;base64," + base64.b64encode(CHECKOUT_HTML.encode("utf-8")).decode("ascii")
+
+
+def js_call(fn: str, *args: Any) -> str:
+    """Format a window-level call with JSON-encoded arguments."""
+    return f"window.{fn}({', '.join(json.dumps(a) for a in args)})"
+
+
+def js_batch(page, *calls: str) -> None:
+    """Run several JS calls in one page.evaluate round-trip."""
+    page.evaluate("() => { " + "; ".join(calls) + "; }")
+
+
+@dataclass(frozen=True, slots=True)
+class PhoneGeom:
+    """Hand-animation targets inside the simulated phone, in page coordinates."""
+
+    cx: float
+    cy: float
+    input_y: float
+    decline_y: float
+    messages_y: float
+    card_y: float
+    pay_y: float
+
+    @classmethod
+    def from_box(cls, box: Dict[str, float]) -> "PhoneGeom":
+        cx = box["x"] + box["width"] / 2
+        cy = box["y"] + box["height"] / 2
+        return cls(
+            cx=cx,
+            cy=cy,
+            input_y=box["y"] + box["height"] - 50,
+            decline_y=cy + 280,
+            messages_y=cy + 100,
+            card_y=cy - 20,
+            pay_y=cy + 160,
+        )
+
+
+def phone_geom(page) -> PhoneGeom:
+    """Measure the phone once per step so targets follow resizes and animations."""
+    return PhoneGeom.from_box(page.locator(".phone").bounding_box())
+
 
 def run_demo(runner: BrilliantDemo, page):
     """
@@ -349,8 +784,7 @@ def run_demo(runner: BrilliantDemo, page):
     # Purge previous data and get initial state
     runner.purge_phone(phone)
     time.sleep(1)
-    _, msgs = runner.get_transcript(phone)
-    ids = [m.id for m in msgs if m.id]
+    runner.mark_seen(phone)
 
     # =========================================================================
     # Step 1: Missed Call - Show full iOS incoming call UI
@@ -358,18 +792,13 @@ def run_demo(runner: BrilliantDemo, page):
     print("\n  [Step 1] MISSED CALL")
     print("           Patient's phone rings... (4 rings)")
 
-    # Get phone position for hand animation
-    phone_bounds = page.locator(".phone").bounding_box()
-    phone_center_x = phone_bounds["x"] + phone_bounds["width"] / 2
-    phone_center_y = phone_bounds["y"] + phone_bounds["height"] / 2
-
     # Show incoming call with full iOS UI
-    page.evaluate(f"window.showIncomingCall('{CLINIC_NAME}', '{CLINIC_AVATAR}')")
+    page.evaluate(js_call("showIncomingCall", CLINIC_NAME, CLINIC_AVATAR))
     time.sleep(6)  # Let it ring 3 times
 
     # Show hand swiping to decline (patient misses call)
-    decline_btn_y = phone_center_y + 280
-    page.evaluate(f"window.showHand({phone_center_x - 60}, {decline_btn_y})")
+    g = phone_geom(page)
+    page.evaluate(f"window.showHand({g.cx - 60}, {g.decline_y})")
     time.sleep(0.8)
     page.evaluate("window.endCall('no answer')")
     time.sleep(1.5)
@@ -379,40 +808,36 @@ def run_demo(runner: BrilliantDemo, page):
     runner.send_telnyx_voice_webhook(phone, hangup_cause="no_answer")
 
     # Wait for AI's proactive outreach message
-    ack = runner.wait_for_message(phone, since_ids=ids, kind="voice_ack", timeout_s=30)
+    ack = runner.wait_for_message(phone, kind="voice_ack", timeout_s=30)
     if ack:
         # Show notification banner when AI message arrives
         preview = ack.body[:50] + "..." if len(ack.body) > 50 else ack.body
-        page.evaluate(f"window.showNotification('{CLINIC_NAME}', '{preview}', 4000)")
+        page.evaluate(js_call("showNotification", CLINIC_NAME, preview, 4000))
         print(f"           AI: \"{ack.body[:80]}...\"")
     time.sleep(message_delay())
 
     # =========================================================================
     # Step 2: Customer reads message and inquires about weight loss
     # =========================================================================
-    _, msgs = runner.get_transcript(phone)
-    ids = [m.id for m in msgs if m.id]
+    runner.mark_seen(phone)
 
     print("\n  [Step 2] WEIGHT LOSS INQUIRY")
     print("           (Customer reads the message...)")
     time.sleep(reading_delay())
 
     # Show hand tapping on message input
-    input_y = phone_bounds["y"] + phone_bounds["height"] - 50
-    page.evaluate(f"window.tapHand({phone_center_x}, {input_y})")
+    g = phone_geom(page)
+    page.evaluate(f"window.tapHand({g.cx}, {g.input_y})")
     time.sleep(0.5)
 
     inquiry = "Hi! I've been seeing ads about weight loss shots. Do you offer that? How does it work?"
     print(f"           Customer: \"{inquiry}\"")
 
-    # Play sent sound and hide hand
-    page.evaluate("window.playSentSound()")
-    page.evaluate("window.hideHand()")
+    # Play sent sound, hide hand and show typing indicator while waiting
+    js_batch(page, "window.playSentSound()", "window.hideHand()", "window.showTyping()")
     runner.send_telnyx_sms_webhook(phone, inquiry)
 
-    # Show typing indicator while waiting
-    page.evaluate("window.showTyping()")
-    reply1 = runner.wait_for_message(phone, since_ids=ids, kind="ai_reply", timeout_s=ai_wait_timeout())
+    reply1 = runner.wait_for_message(phone, kind="ai_reply", timeout_s=ai_wait_timeout())
     page.evaluate("window.hideTyping()")
 
     if reply1:
@@ -425,25 +850,23 @@ def run_demo(runner: BrilliantDemo, page):
     # =========================================================================
     # Step 3: Customer asks about pricing and timeline
     # =========================================================================
-    _, msgs = runner.get_transcript(phone)
-    ids = [m.id for m in msgs if m.id]
+    runner.mark_seen(phone)
 
     print("\n  [Step 3] PRICING QUESTION")
     print("           (Customer reads the detailed response...)")
     time.sleep(reading_delay())
 
-    page.evaluate(f"window.tapHand({phone_center_x}, {input_y})")
+    g = phone_geom(page)
+    page.evaluate(f"window.tapHand({g.cx}, {g.input_y})")
     time.sleep(0.5)
 
     pricing_q = "That sounds perfect! How much does it cost per month and how quickly can I get started?"
     print(f"           Customer: \"{pricing_q}\"")
 
-    page.evaluate("window.playSentSound()")
-    page.evaluate("window.hideHand()")
+    js_batch(page, "window.playSentSound()", "window.hideHand()", "window.showTyping()")
     runner.send_telnyx_sms_webhook(phone, pricing_q)
 
-    page.evaluate("window.showTyping()")
-    reply2 = runner.wait_for_message(phone, since_ids=ids, kind="ai_reply", timeout_s=ai_wait_timeout())
+    reply2 = runner.wait_for_message(phone, kind="ai_reply", timeout_s=ai_wait_timeout())
     page.evaluate("window.hideTyping()")
 
     if reply2:
@@ -455,35 +878,40 @@ def run_demo(runner: BrilliantDemo, page):
     # =========================================================================
     # Step 4: Customer is ready to book
     # =========================================================================
-    _, msgs = runner.get_transcript(phone)
-    ids = [m.id for m in msgs if m.id]
+    runner.mark_seen(phone)
 
     print("\n  [Step 4] BOOKING DECISION")
     print("           (Customer is convinced...)")
     time.sleep(reading_delay())
 
-    page.evaluate(f"window.tapHand({phone_center_x}, {input_y})")
+    g = phone_geom(page)
+    page.evaluate(f"window.tapHand({g.cx}, {g.input_y})")
     time.sleep(0.5)
 
     booking_msg = "I'm ready to book! I'm Jennifer. Do you have anything available this week? Happy to pay the deposit."
     print(f"           Customer: \"{booking_msg}\"")
 
-    page.evaluate("window.playSentSound()")
-    page.evaluate("window.hideHand()")
+    js_batch(page, "window.playSentSound()", "window.hideHand()", "window.showTyping()")
     runner.send_telnyx_sms_webhook(phone, booking_msg)
 
-    # Wait for AI reply
-    page.evaluate("window.showTyping()")
-    ai_reply = runner.wait_for_message(phone, since_ids=ids, kind="ai_reply", timeout_s=ai_wait_timeout())
-    page.evaluate("window.hideTyping()")
+    # Wait for the AI reply and deposit link together - they can arrive in either order.
+    # Both waiters share transcript polls; page interactions stay on this thread.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ai_future = pool.submit(
+            runner.wait_for_message, phone, kind="ai_reply", timeout_s=ai_wait_timeout()
+        )
+        deposit_future = pool.submit(
+            runner.wait_for_message, phone, kind="deposit_link", timeout_s=ai_wait_timeout() + 30
+        )
+        ai_reply = ai_future.result()
+        page.evaluate("window.hideTyping()")
 
-    if ai_reply:
-        time.sleep(0.3)
-        page.evaluate("window.playTriTone()")
-        print(f"           AI: \"{ai_reply.body[:100]}...\"")
+        if ai_reply:
+            time.sleep(0.3)
+            page.evaluate("window.playTriTone()")
+            print(f"           AI: \"{ai_reply.body[:100]}...\"")
 
-    # Wait for deposit link
-    deposit_link = runner.wait_for_message(phone, since_ids=ids, kind="deposit_link", timeout_s=30)
+        deposit_link = deposit_future.result()
     if deposit_link:
         time.sleep(0.3)
         page.evaluate("window.playTriTone()")
@@ -492,7 +920,7 @@ def run_demo(runner: BrilliantDemo, page):
         # Search for Square link in messages
         _, msgs = runner.get_transcript(phone)
         for m in msgs:
-            if m.id not in ids and "checkout.square" in m.body.lower():
+            if m.id not in runner.seen and _SQUARE_CHECKOUT_RE.search(m.body):
                 deposit_link = m
                 break
     time.sleep(message_delay())
@@ -504,25 +932,23 @@ def run_demo(runner: BrilliantDemo, page):
 
     checkout_url = None
     if deposit_link:
-        url_match = re.search(r'https?://[^\s]+', deposit_link.body)
+        url_match = _URL_RE.search(deposit_link.body)
         if url_match:
             checkout_url = url_match.group(0)
 
-    _, msgs = runner.get_transcript(phone)
-    ids_before_payment = [m.id for m in msgs if m.id]
+    runner.mark_seen(phone)
 
     if checkout_url:
         print(f"           Customer taps payment link...")
 
         # Show hand tapping on the link
-        messages_area_y = phone_center_y + 100
-        page.evaluate(f"window.tapHand({phone_center_x}, {messages_area_y})")
+        g = phone_geom(page)
+        page.evaluate(f"window.tapHand({g.cx}, {g.messages_y})")
         time.sleep(0.6)
         page.evaluate("window.hideHand()")
 
         # Open simulated checkout inside phone browser
-        checkout_b64 = base64.b64encode(CHECKOUT_HTML.encode()).decode()
-        page.evaluate(f"window.openBrowser('data:text/html;base64,{checkout_b64}')")
+        page.evaluate(f"window.openBrowser({json.dumps(_CHECKOUT_DATA_URI)})")
         print("           [Checkout page opens in phone]")
         time.sleep(2)
 
@@ -530,8 +956,7 @@ def run_demo(runner: BrilliantDemo, page):
         print("           Customer enters card details...")
 
         # Show hand typing card number
-        card_input_y = phone_center_y - 20
-        page.evaluate(f"window.showHand({phone_center_x}, {card_input_y})")
+        page.evaluate(f"window.showHand({g.cx}, {g.card_y})")
         time.sleep(1.5)
 
         # Fill in card number via JavaScript
@@ -547,8 +972,7 @@ def run_demo(runner: BrilliantDemo, page):
             print(f"           (Card input automation skipped: {e})")
 
         # Tap pay button
-        pay_btn_y = phone_center_y + 160
-        page.evaluate(f"window.tapHand({phone_center_x}, {pay_btn_y})")
+        page.evaluate(f"window.tapHand({g.cx}, {g.pay_y})")
         time.sleep(0.5)
 
         try:
@@ -561,8 +985,7 @@ def run_demo(runner: BrilliantDemo, page):
         time.sleep(2)
 
         # Close browser and show payment success overlay
-        page.evaluate("window.closeBrowser()")
-        page.evaluate("window.showPaymentSuccess('$50.00 deposit confirmed')")
+        js_batch(page, "window.closeBrowser()", js_call("showPaymentSuccess", "$50.00 deposit confirmed"))
         print("           PAYMENT COMPLETE!")
         time.sleep(2.5)
         page.evaluate("window.hidePaymentSuccess()")
@@ -590,12 +1013,11 @@ def run_demo(runner: BrilliantDemo, page):
     print("           Waiting for confirmation SMS...")
 
     confirm = runner.wait_for_message(
-        phone, since_ids=ids_before_payment, kind="payment_confirmation", timeout_s=60
+        phone, kind="payment_confirmation", timeout_s=60
     )
     if confirm:
         # Show notification banner for confirmation
-        page.evaluate(f"window.showNotification('{CLINIC_NAME}', 'Payment confirmed! ✓', 5000)")
-        page.evaluate("window.playTriTone()")
+        js_batch(page, js_call("showNotification", CLINIC_NAME, "Payment confirmed! ✓", 5000), "window.playTriTone()")
         print(f"           CONFIRMATION: \"{confirm.body[:90]}...\"")
         time.sleep(3)
 
@@ -706,6 +1128,28 @@ METRICS_OVERLAY_JS = """
         if (valDep) valDep.textContent = '$' + (depositsCents / 100).toFixed(0);
         if (valRate) valRate.textContent = conversionRate.toFixed(0) + '%';
     };
+
+    // Refresh from the dashboard API on a browser timer, independent of demo steps.
+    // Playwright's sync API is bound to the main thread, so the page polls for itself.
+    window.startMetricsRefresh = function(url, intervalMs) {
+        if (window._metricsTimer) clearInterval(window._metricsTimer);
+        const refresh = () => fetch(url, { cache: 'no-store' })
+            .then(r => r.ok ? r.json() : null)
+            .then(m => m && window.updateMetrics(
+                (m.conversations || {}).unique_conversations || 0,
+                (m.payments || {}).total_collected_cents || 0,
+                (m.leads || {}).conversion_rate || 0
+            ))
+            .catch(() => {});
+        window._metricsTimer = setInterval(refresh, intervalMs);
+    };
+
+    window.stopMetricsRefresh = function() {
+        if (window._metricsTimer) clearInterval(window._metricsTimer);
+        window._metricsTimer = null;
+    };
+
+    window.__metricsOverlayReady = true;
 })();
 """
 
@@ -778,72 +1222,82 @@ def main() -> int:
     print(f"{'='*60}\n")
 
     # Start Playwright
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
 
     video_path: Optional[str] = None
 
-    with sync_playwright() as p:
-        # Try multiple browsers as fallback on Windows
+    with runner, sync_playwright() as p:
+        # Try multiple browsers as fallback on Windows. Launches stay sequential:
+        # the sync Playwright API is bound to this thread, so probes can't run in parallel.
         browser = None
+        headless = not args.headed
         for browser_name, launch_fn in [
-            ("Edge", lambda: p.chromium.launch(channel="msedge", headless=not args.headed)),
-            ("Chromium", lambda: p.chromium.launch(headless=not args.headed)),
-            ("Firefox", lambda: p.firefox.launch(headless=not args.headed)),
+            ("Edge", lambda timeout: p.chromium.launch(channel="msedge", headless=headless, timeout=timeout)),
+            ("Chromium", lambda timeout: p.chromium.launch(headless=headless, timeout=timeout)),
+            ("Firefox", lambda timeout: p.firefox.launch(headless=headless, timeout=timeout)),
         ]:
-            try:
-                print(f"  Launching {browser_name}...")
-                browser = launch_fn()
-                print(f"  {browser_name} launched successfully!")
+            print(f"  Launching {browser_name}...")
+            for attempt in range(LAUNCH_ATTEMPTS):
+                try:
+                    browser = launch_fn(launch_timeout_ms() * 2 ** attempt)
+                    print(f"  {browser_name} launched successfully!")
+                    break
+                except PlaywrightTimeoutError as e:
+                    # Slow start: back off with jitter and retry before giving up on this browser
+                    print(f"  {browser_name} attempt {attempt + 1} timed out: {str(e)[:100]}")
+                    if attempt + 1 < LAUNCH_ATTEMPTS:
+                        time.sleep(0.25 * 2 ** attempt + random.random() * 0.1)
+                except Exception as e:
+                    # Missing executable and the like won't fix themselves; move on
+                    print(f"  {browser_name} failed: {str(e)[:100]}")
+                    break
+            if browser is not None:
                 break
-            except Exception as e:
-                print(f"  {browser_name} failed: {str(e)[:100]}")
-                continue
         if browser is None:
             raise RuntimeError("Could not launch any browser")
-        context = browser.new_context(
+        # Page, context and browser close in reverse order on exit, even if the demo
+        # raises; closing the context is what finalizes the video file.
+        with browser, browser.new_context(
             viewport={"width": 1280, "height": 900},
             record_video_dir=str(videos_dir),
             record_video_size={"width": 1280, "height": 900},
             extra_http_headers={"Authorization": f"Bearer {token}"},
-        )
-        page = context.new_page()
-
-        try:
-            # Navigate to enhanced phone simulator
-            phone_url = (
-                f"{api_url}/admin/e2e/phone-simulator-demo"
-                f"?orgID={quote(runner.org_id)}"
-                f"&phone={quote(runner.customer_phone, safe='')}"
-                f"&clinic={quote(runner.clinic_phone, safe='')}"
-                f"&clinic_name={quote(CLINIC_NAME)}"
-                f"&poll_ms=600"
-            )
-            page.goto(phone_url, wait_until="networkidle")
-            time.sleep(1)
-
-            # Inject metrics overlay
-            page.evaluate(METRICS_OVERLAY_JS)
-            update_dashboard_overlay(runner, page)
-            time.sleep(2)
+        ) as context, context.new_page() as page:
+            if page.video:
+                video_path = page.video.path()
 
-            # Run the demo
-            result = run_demo(runner, page)
-
-            # Update final metrics
-            update_dashboard_overlay(runner, page)
-            time.sleep(5)
-
-        except Exception:
-            page.screenshot(path=str(artifacts_dir / "failure.png"), full_page=True)
-            (artifacts_dir / "error.txt").write_text(traceback.format_exc(), encoding="utf-8")
-            raise
-        finally:
-            page.close()
-            context.close()
-            video = page.video
-            if video:
-                video_path = video.path()
-            browser.close()
+            try:
+                # Navigate to enhanced phone simulator
+                phone_url = (
+                    f"{api_url}/admin/e2e/phone-simulator-demo"
+                    f"?orgID={quote(runner.org_id)}"
+                    f"&phone={quote(runner.customer_phone, safe='')}"
+                    f"&clinic={_CLINIC_PHONE_Q}"
+                    f"&clinic_name={_CLINIC_NAME_Q}"
+                    f"&poll_ms=600"
+                )
+                page.goto(phone_url, wait_until="networkidle")
+
+                # Inject metrics overlay; the page keeps it fresh while the demo runs
+                page.evaluate(METRICS_OVERLAY_JS)
+                page.wait_for_function("window.__metricsOverlayReady === true", timeout=3000)
+                update_dashboard_overlay(runner, page)
+                page.evaluate(js_call("startMetricsRefresh", runner.dashboard_url, OVERLAY_REFRESH_MS))
+
+                # Run the demo
+                result = run_demo(runner, page)
+
+                # Update final metrics
+                page.evaluate("window.stopMetricsRefresh()")
+                update_dashboard_overlay(runner, page)
+                # Hold the final numbers on screen long enough to be readable in the video
+                time.sleep(message_delay())
+
+            except Exception:
+                page.screenshot(path=str(artifacts_dir / "failure.png"), full_page=True)
+                import traceback
+                (artifacts_dir / "error.txt").write_text(traceback.format_exc(), encoding="utf-8")
+                raise
 
     print(f"\n{'='*60}")
     print("  Demo Recording Complete")
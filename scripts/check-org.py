@@ -1,80 +1,43 @@
 #!/usr/bin/env python3
 """Check org ID for clinic@example.com"""
 
-import json
-import subprocess
 import sys
-import time
-import hmac
-import hashlib
-import base64
-import urllib.request
-import urllib.error
-import ssl
+from concurrent.futures import ThreadPoolExecutor
+
+from admin_api import api_request, preview
+from dev_secrets import get_dev_admin_token
 
 API_URL = "https://api-dev.aiwolfsolutions.com"
+PREVIEW_MAX_BYTES = 64 * 1024
 
-def get_secrets():
-    result = subprocess.run(
-        ["aws", "secretsmanager", "get-secret-value",
-         "--secret-id", "medspa-development-app-secrets",
-         "--query", "SecretString", "--output", "text"],
-        capture_output=True, text=True
-    )
-    return json.loads(result.stdout)
+def api_get(url: str, token: str, limit):
+    # Previewed responses don't need huge bodies in full; full dumps (limit None) read everything
+    max_bytes = None if limit is None else PREVIEW_MAX_BYTES
+    return api_request(url, token, max_bytes=max_bytes)[0]
 
-def create_jwt(secret: str, email: str = None) -> str:
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b'=').decode()
-    now = int(time.time())
-    payload = {"sub": "admin", "iat": now, "exp": now + 3600}
-    if email:
-        payload["email"] = email
-    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b'=').decode()
-    message = f"{header_b64}.{payload_b64}"
-    signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=').decode()
-    return f"{message}.{signature_b64}"
+token = get_dev_admin_token()
 
-def api_get(url: str, token: str):
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {token}")
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    try:
-        with urllib.request.urlopen(req, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {body[:500]}"}
-    except Exception as e:
-        return {"error": str(e)}
+FOREVER22_ORG = "bb507f20-7fcc-4941-9eac-9ed93b7834ed"
 
-secrets = get_secrets()
-token = create_jwt(secrets["ADMIN_JWT_SECRET"])
+# (heading, label, url, preview chars or None for the full response)
+PROBES = [
+    ("1. List all clinics:", "Response", f"{API_URL}/admin/clinics", None),
+    ("2. Looking up org by email (clinic@example.com):", "Response",
+     f"{API_URL}/api/client/org?email=clinic@example.com", None),
+    (f"3. Direct check of Forever 22 org ({FOREVER22_ORG}):", "Dashboard",
+     f"{API_URL}/portal/orgs/{FOREVER22_ORG}/dashboard", None),
+    ("4. Check organizations table directly via admin endpoint:", "Admin dashboard",
+     f"{API_URL}/admin/dashboard", 1000),
+]
 
 print("=" * 60)
 print("Checking org mappings")
 print("=" * 60)
 
-# Check all orgs/clinics
-print("\n1. List all clinics:")
-clinics = api_get(f"{API_URL}/admin/clinics", token)
-print(f"   Response: {json.dumps(clinics, indent=2)}")
-
-# Check org lookup by email
-print("\n2. Looking up org by email (clinic@example.com):")
-org_lookup = api_get(f"{API_URL}/api/client/org?email=clinic@example.com", token)
-print(f"   Response: {json.dumps(org_lookup, indent=2)}")
-
-# Check the known Forever 22 org ID
-FOREVER22_ORG = "bb507f20-7fcc-4941-9eac-9ed93b7834ed"
-print(f"\n3. Direct check of Forever 22 org ({FOREVER22_ORG}):")
-dashboard = api_get(f"{API_URL}/portal/orgs/{FOREVER22_ORG}/dashboard", token)
-print(f"   Dashboard: {json.dumps(dashboard, indent=2)}")
+# The probes are independent; fetch them together and print in order
+with ThreadPoolExecutor(max_workers=len(PROBES)) as pool:
+    results = list(pool.map(lambda probe: api_get(probe[2], token, probe[3]), PROBES))
 
-# Check if there are multiple orgs
-print("\n4. Check organizations table directly via admin endpoint:")
-admin_dashboard = api_get(f"{API_URL}/admin/dashboard", token)
-print(f"   Admin dashboard: {json.dumps(admin_dashboard, indent=2)[:1000]}")
+for (heading, label, _, limit), result in zip(PROBES, results):
+    print(f"\n{heading}")
+    print(f"   {label}: {preview(result, limit)}")
@@ -2,62 +2,21 @@
 """Check knowledge data for Forever 22 Med Spa."""
 
 import json
-import subprocess
-import sys
-import time
-import hmac
-import hashlib
-import base64
-import urllib.request
-import urllib.error
-import ssl
+
+from admin_api import api_request
+from dev_secrets import get_dev_admin_token
 
 # Forever 22 Med Spa org ID
 FOREVER22_ORG_ID = "d0f9d4b4-05d2-40b3-ad4b-ae9a3b5c8599"
 API_URL = "https://api-dev.aiwolfsolutions.com"
 
-def get_secrets():
-    """Fetch secrets from AWS Secrets Manager."""
-    result = subprocess.run(
-        ["aws", "secretsmanager", "get-secret-value",
-         "--secret-id", "medspa-development-app-secrets",
-         "--query", "SecretString", "--output", "text"],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        print(f"Error fetching secrets: {result.stderr}")
-        sys.exit(1)
-    return json.loads(result.stdout)
-
-def create_jwt(secret: str) -> str:
-    """Create JWT token for admin authentication."""
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b'=').decode()
-    now = int(time.time())
-    payload = {"sub": "admin", "iat": now, "exp": now + 3600}
-    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b'=').decode()
-    message = f"{header_b64}.{payload_b64}"
-    signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=').decode()
-    return f"{message}.{signature_b64}"
-
 def api_get(url: str, token: str):
     """Make GET request to API."""
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {token}")
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    try:
-        with urllib.request.urlopen(req, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        print(f"   [ERROR] HTTP {e.code}: {body[:500]}")
-        return {"error": f"HTTP {e.code}"}
-    except Exception as e:
-        print(f"   [ERROR] Error: {e}")
-        return {"error": str(e)}
+    payload, status = api_request(url, token)
+    if status == 0 or status >= 400:
+        print(f"   [ERROR] {payload['error']}")
+        return {"error": f"HTTP {status}" if status else payload["error"]}
+    return payload
 
 def main():
     print("=" * 70)
@@ -66,9 +25,8 @@ def main():
     print(f"\nOrg ID: {FOREVER22_ORG_ID}")
     print(f"API URL: {API_URL}\n")
 
-    # Get admin JWT secret
-    secrets = get_secrets()
-    token = create_jwt(secrets["ADMIN_JWT_SECRET"])
+    # Get admin JWT
+    token = get_dev_admin_token()
 
     # Check portal knowledge endpoint
     print("[1] Portal Knowledge API")
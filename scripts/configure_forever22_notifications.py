@@ -4,16 +4,10 @@
 This script sets up email and SMS notifications for deposit payments.
 """
 
-import json
-import subprocess
 import sys
-import time
-import hmac
-import hashlib
-import base64
-import urllib.request
-import urllib.error
-import ssl
+
+from admin_api import api_request
+from dev_secrets import get_dev_admin_token
 
 # Configuration
 API_URL = "https://api-dev.aiwolfsolutions.com"
@@ -24,57 +18,6 @@ EMAIL_RECIPIENTS = ["wolfpassion20@gmail.com", "andrew@aiwolfsolutions.com"]
 SMS_RECIPIENTS = ["+15005550001"]  # Format: +1XXXXXXXXXX
 
 
-def get_secrets():
-    """Fetch secrets from AWS Secrets Manager."""
-    result = subprocess.run(
-        ["aws", "secretsmanager", "get-secret-value",
-         "--secret-id", "medspa-development-app-secrets",
-         "--query", "SecretString", "--output", "text"],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        print(f"Error fetching secrets: {result.stderr}")
-        sys.exit(1)
-    return json.loads(result.stdout)
-
-
-def create_jwt(secret: str) -> str:
-    """Create a JWT for admin API access."""
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b'=').decode()
-    now = int(time.time())
-    payload = {"sub": "admin", "iat": now, "exp": now + 3600}
-    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b'=').decode()
-    message = f"{header_b64}.{payload_b64}"
-    signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=').decode()
-    return f"{message}.{signature_b64}"
-
-
-def api_request(url: str, token: str, method: str = "GET", data: dict = None):
-    """Make an API request."""
-    req = urllib.request.Request(url, method=method)
-    req.add_header("Authorization", f"Bearer {token}")
-    req.add_header("Content-Type", "application/json")
-
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-
-    body = None
-    if data:
-        body = json.dumps(data).encode()
-
-    try:
-        with urllib.request.urlopen(req, data=body, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode()), response.status
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {error_body[:500]}"}, e.code
-    except Exception as e:
-        return {"error": str(e)}, 0
-
-
 def main():
     print("=" * 60)
     print("Forever 22 Med Spa - Notification Settings Configuration")
@@ -82,8 +25,7 @@ def main():
 
     # Get secrets and create JWT
     print("\n1. Authenticating...")
-    secrets = get_secrets()
-    token = create_jwt(secrets["ADMIN_JWT_SECRET"])
+    token = get_dev_admin_token()
     print("   Authentication successful")
 
     # Get current notification settings
@@ -1,83 +1,40 @@
 #!/usr/bin/env python3
 """Debug what data exists for Forever 22."""
 
-import json
-import subprocess
 import sys
-import time
-import hmac
-import hashlib
-import base64
-import urllib.request
-import urllib.error
-import ssl
+from concurrent.futures import ThreadPoolExecutor
+
+from admin_api import api_request, preview
+from dev_secrets import get_dev_admin_token
 
 ORG_ID = "bb507f20-7fcc-4941-9eac-9ed93b7834ed"
 API_URL = "https://api-dev.aiwolfsolutions.com"
+PREVIEW_MAX_BYTES = 64 * 1024
 
-def get_secrets():
-    result = subprocess.run(
-        ["aws", "secretsmanager", "get-secret-value",
-         "--secret-id", "medspa-development-app-secrets",
-         "--query", "SecretString", "--output", "text"],
-        capture_output=True, text=True
-    )
-    return json.loads(result.stdout)
-
-def create_jwt(secret: str) -> str:
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b'=').decode()
-    now = int(time.time())
-    payload = {"sub": "admin", "iat": now, "exp": now + 3600}
-    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b'=').decode()
-    message = f"{header_b64}.{payload_b64}"
-    signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=').decode()
-    return f"{message}.{signature_b64}"
+def api_get(url: str, token: str, limit):
+    # Previewed responses don't need huge bodies in full; full dumps (limit None) read everything
+    max_bytes = None if limit is None else PREVIEW_MAX_BYTES
+    return api_request(url, token, max_bytes=max_bytes)[0]
 
-def api_get(url: str, token: str):
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {token}")
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    try:
-        with urllib.request.urlopen(req, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {body[:200]}"}
-    except Exception as e:
-        return {"error": str(e)}
+token = get_dev_admin_token()
 
-secrets = get_secrets()
-token = create_jwt(secrets["ADMIN_JWT_SECRET"])
+# (heading, path, preview chars or None for the full response)
+PROBES = [
+    ("1. Admin Leads API (/admin/clinics/{orgID}/leads):", f"/admin/clinics/{ORG_ID}/leads", 500),
+    ("2. Portal Dashboard (/portal/orgs/{orgID}/dashboard):", f"/portal/orgs/{ORG_ID}/dashboard", None),
+    ("3. Portal Conversations (/portal/orgs/{orgID}/conversations):", f"/portal/orgs/{ORG_ID}/conversations", 500),
+    ("4. Portal Deposits (/portal/orgs/{orgID}/deposits):", f"/portal/orgs/{ORG_ID}/deposits", 500),
+    ("5. Clinic Stats (/admin/clinics/{orgID}/stats):", f"/admin/clinics/{ORG_ID}/stats", 500),
+]
 
 print("=" * 60)
 print("DEBUG: Forever 22 Med Spa Data")
 print("=" * 60)
 
-# Check admin leads endpoint
-print("\n1. Admin Leads API (/admin/clinics/{orgID}/leads):")
-leads = api_get(f"{API_URL}/admin/clinics/{ORG_ID}/leads", token)
-print(f"   Response: {json.dumps(leads, indent=2)[:500]}")
-
-# Check portal dashboard
-print("\n2. Portal Dashboard (/portal/orgs/{orgID}/dashboard):")
-dashboard = api_get(f"{API_URL}/portal/orgs/{ORG_ID}/dashboard", token)
-print(f"   Response: {json.dumps(dashboard, indent=2)}")
-
-# Check portal conversations
-print("\n3. Portal Conversations (/portal/orgs/{orgID}/conversations):")
-convos = api_get(f"{API_URL}/portal/orgs/{ORG_ID}/conversations", token)
-print(f"   Response: {json.dumps(convos, indent=2)[:500]}")
-
-# Check portal deposits
-print("\n4. Portal Deposits (/portal/orgs/{orgID}/deposits):")
-deposits = api_get(f"{API_URL}/portal/orgs/{ORG_ID}/deposits", token)
-print(f"   Response: {json.dumps(deposits, indent=2)[:500]}")
+# The probes are independent; fetch them together and print in order
+with ThreadPoolExecutor(max_workers=len(PROBES)) as pool:
+    results = list(pool.map(lambda probe: api_get(f"{API_URL}{probe[1]}", token, probe[2]), PROBES))
 
-# Check clinic stats
-print("\n5. Clinic Stats (/admin/clinics/{orgID}/stats):")
-stats = api_get(f"{API_URL}/admin/clinics/{ORG_ID}/stats", token)
-print(f"   Response: {json.dumps(stats, indent=2)[:500]}")
+for (heading, _, limit), result in zip(PROBES, results):
+    print(f"\n{heading}")
+    print(f"   Response: {preview(result, limit)}")
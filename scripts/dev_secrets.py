@@ -0,0 +1,72 @@
+"""Development app secrets from AWS Secrets Manager, cached between runs.
+
+The aws CLI takes a second or more per call, so the bundle is kept in memory
+for the life of the process. Only the keys in DISK_CACHED_KEYS are also written
+to disk, in plaintext (mode 0600, under the user's cache dir), for
+SECRETS_CACHE_TTL seconds; anyone who can read that file can use them until
+they are rotated. Set MEDSPA_SECRETS_CACHE_TTL=0 to skip the disk cache.
+"""
+
+import functools
+import json
+import os
+import subprocess
+import sys
+import time
+
+from admin_jwt import CACHE_DIR, get_admin_jwt, write_private_json
+
+SECRET_ID = "medspa-development-app-secrets"
+SECRETS_CACHE_FILE = CACHE_DIR / "secrets.json"
+SECRETS_CACHE_TTL = int(os.getenv("MEDSPA_SECRETS_CACHE_TTL", "300"))
+# The keys the helper scripts read via get_secret(); the rest of the bundle never touches disk
+DISK_CACHED_KEYS = ("ADMIN_JWT_SECRET", "DATABASE_URL")
+
+
+def _disk_cached_secrets() -> dict:
+    """Secrets from the disk cache, or {} when it is disabled, missing, or stale."""
+    if SECRETS_CACHE_TTL <= 0:
+        return {}
+    try:
+        if time.time() - SECRETS_CACHE_FILE.stat().st_mtime < SECRETS_CACHE_TTL:
+            return json.loads(SECRETS_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def get_secrets() -> dict:
+    """Fetch the full secrets bundle from AWS Secrets Manager."""
+    result = subprocess.run(
+        ["aws", "secretsmanager", "get-secret-value",
+         "--secret-id", SECRET_ID,
+         "--query", "SecretString", "--output", "text"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        print(f"Error fetching secrets: {result.stderr.decode(errors='replace')}")
+        sys.exit(1)
+    # json.loads takes the raw bytes; no need to decode stdout to str first
+    secrets = json.loads(result.stdout)
+    if SECRETS_CACHE_TTL > 0:
+        write_private_json(SECRETS_CACHE_FILE, {k: secrets[k] for k in DISK_CACHED_KEYS if k in secrets})
+    return secrets
+
+
+def get_secret(name: str, default=None):
+    """One secret value, read from the disk cache when it holds that key."""
+    if name in DISK_CACHED_KEYS:
+        cached = _disk_cached_secrets()
+        if name in cached:
+            return cached[name]
+    return get_secrets().get(name, default)
+
+
+def get_dev_admin_token() -> str:
+    """Admin JWT for the dev API, signed with the secret from Secrets Manager."""
+    secret = get_secret("ADMIN_JWT_SECRET")
+    if not secret:
+        print(f"Error: ADMIN_JWT_SECRET missing from {SECRET_ID}")
+        sys.exit(1)
+    return get_admin_jwt(secret)
@@ -8,19 +8,15 @@ This script:
 4. Verifies notification was sent by checking logs
 """
 
-import json
 import subprocess
 import sys
 import time
-import hmac
-import hashlib
-import base64
-import urllib.request
-import urllib.error
-import ssl
 import uuid
 from datetime import datetime
 
+from admin_api import SESSION
+from dev_secrets import get_secret
+
 # Configuration
 API_URL = "https://api-dev.aiwolfsolutions.com"
 FOREVER22_ORG_ID = "bb507f20-7fcc-4941-9eac-9ed93b7834ed"
@@ -38,61 +34,9 @@ DEMO_PATIENT = {
 }
 
 
-def get_secrets():
-    """Fetch secrets from AWS Secrets Manager."""
-    result = subprocess.run(
-        ["aws", "secretsmanager", "get-secret-value",
-         "--secret-id", "medspa-development-app-secrets",
-         "--query", "SecretString", "--output", "text"],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        print(f"Error fetching secrets: {result.stderr}")
-        sys.exit(1)
-    return json.loads(result.stdout)
-
-
-def create_jwt(secret: str) -> str:
-    """Create a JWT for admin API access."""
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b'=').decode()
-    now = int(time.time())
-    payload = {"sub": "admin", "iat": now, "exp": now + 3600}
-    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b'=').decode()
-    message = f"{header_b64}.{payload_b64}"
-    signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=').decode()
-    return f"{message}.{signature_b64}"
-
-
 def get_db_connection_string():
     """Get database connection string from secrets."""
-    secrets = get_secrets()
-    return secrets.get("DATABASE_URL", "")
-
-
-def api_request(url: str, token: str, method: str = "GET", data: dict = None):
-    """Make an API request."""
-    req = urllib.request.Request(url, method=method)
-    req.add_header("Authorization", f"Bearer {token}")
-    req.add_header("Content-Type", "application/json")
-
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-
-    body = None
-    if data:
-        body = json.dumps(data).encode()
-
-    try:
-        with urllib.request.urlopen(req, data=body, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode()), response.status
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {error_body[:500]}"}, e.code
-    except Exception as e:
-        return {"error": str(e)}, 0
+    return get_secret("DATABASE_URL", "")
 
 
 def execute_sql(query: str, params: tuple = None) -> list:
@@ -184,20 +128,13 @@ def complete_fake_payment(payment_id: str) -> bool:
     """Complete the fake payment via the demo endpoint."""
     url = f"{API_URL}/demo/payments/{payment_id}/complete"
 
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-
-    req = urllib.request.Request(url, method="POST")
-    req.add_header("Content-Type", "application/json")
-
     try:
-        with urllib.request.urlopen(req, data=b"", context=ctx, timeout=30) as response:
-            return response.status in [200, 302, 303]
-    except urllib.error.HTTPError as e:
-        if e.code in [302, 303]:  # Redirect to success page is expected
+        # Shared dev-API session (and its TLS policy); the redirect to the success page is expected
+        response = SESSION.post(url, data=b"", headers={"Content-Type": "application/json"},
+                                timeout=30, allow_redirects=False)
+        if response.status_code in [200, 302, 303]:
             return True
-        print(f"Payment completion error: {e.code} - {e.read().decode()[:200]}")
+        print(f"Payment completion error: {response.status_code} - {response.text[:200]}")
         return False
     except Exception as e:
         print(f"Payment completion exception: {e}")
@@ -14,31 +14,46 @@ Or provide a token directly:
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library required. Install with: pip install requests")
     sys.exit(1)
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None
-
 API_BASE = os.getenv("API_BASE", "https://api-dev.aiwolfsolutions.com")
 COGNITO_USER_POOL_ID = "us-east-1_eGSeUyPdg"
 COGNITO_CLIENT_ID = os.getenv("COGNITO_CLIENT_ID", "")
 DEFAULT_ORG = "brilliant-aesthetics"
 
+# One keep-alive session for the run: --all fetches a detail per conversation
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# (connect, read): an unreachable API fails in seconds instead of hanging
+TIMEOUT = (3.05, 15)
+
 
 def get_cognito_token(username: str, password: str) -> str:
     """Authenticate with Cognito and return access token."""
-    if not boto3:
+    # Imported here: boto3 is slow to load and only needed without API_TOKEN
+    try:
+        import boto3
+    except ImportError:
         print("Error: boto3 required for Cognito auth. Install with: pip install boto3")
         sys.exit(1)
 
@@ -75,8 +90,9 @@ def get_cognito_token(username: str, password: str) -> str:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
 def get_auth_headers() -> dict:
-    """Get authentication headers."""
+    """Get authentication headers (authenticates once per run)."""
     token = os.getenv("API_TOKEN")
 
     if not token:
@@ -92,37 +108,30 @@ def get_auth_headers() -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
+def api_get(url: str, params: dict = None) -> dict:
+    """GET an admin endpoint; prints the error and returns {} on a non-200."""
+    response = SESSION.get(url, headers=get_auth_headers(), params=params, timeout=TIMEOUT)
+
+    if response.status_code != 200:
+        print(f"Error: {response.status_code} - {response.text}")
+        return {}
+
+    return response.json()
+
+
 def list_conversations(org_id: str, phone: str = None, limit: int = 20) -> list:
     """List conversations for an organization."""
-    headers = get_auth_headers()
-
     params = {"page_size": limit}
     if phone:
         params["phone"] = phone
 
-    url = f"{API_BASE}/admin/orgs/{org_id}/conversations"
-    response = requests.get(url, headers=headers, params=params)
-
-    if response.status_code != 200:
-        print(f"Error: {response.status_code} - {response.text}")
-        return []
-
-    data = response.json()
+    data = api_get(f"{API_BASE}/admin/orgs/{org_id}/conversations", params)
     return data.get("conversations", [])
 
 
 def get_conversation_detail(org_id: str, conversation_id: str) -> dict:
     """Get detailed conversation with messages."""
-    headers = get_auth_headers()
-
-    url = f"{API_BASE}/admin/orgs/{org_id}/conversations/{conversation_id}"
-    response = requests.get(url, headers=headers)
-
-    if response.status_code != 200:
-        print(f"Error: {response.status_code} - {response.text}")
-        return {}
-
-    return response.json()
+    return api_get(f"{API_BASE}/admin/orgs/{org_id}/conversations/{conversation_id}")
 
 
 def format_timestamp(ts: str) -> str:
@@ -145,9 +154,11 @@ def print_conversation_list(conversations: list):
     print(f"{'='*80}")
 
     for conv in conversations:
-        phone = conv.get("customer_phone", "")[-10:] if conv.get("customer_phone") else "Unknown"
+        customer_phone = conv.get("customer_phone")
+        phone = customer_phone[-10:] if customer_phone else "Unknown"
         msg_count = conv.get("message_count", 0)
-        last_msg = format_timestamp(conv.get("last_message_at", "")) if conv.get("last_message_at") else "N/A"
+        last_message_at = conv.get("last_message_at")
+        last_msg = format_timestamp(last_message_at) if last_message_at else "N/A"
         status = conv.get("status", "unknown")
 
         print(f"{phone:<15} {msg_count:<10} {last_msg:<20} {status:<10}")
@@ -207,10 +218,10 @@ def main():
     elif args.all:
         # Show all conversations with messages
         conversations = list_conversations(args.org, args.phone, args.limit)
-        for conv in conversations:
-            conv_id = conv.get("id")
-            if conv_id:
-                detail = get_conversation_detail(args.org, conv_id)
+        conv_ids = [conv["id"] for conv in conversations if conv.get("id")]
+        # Details are independent; fetch them together and print in list order
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for detail in pool.map(lambda conv_id: get_conversation_detail(args.org, conv_id), conv_ids):
                 print_conversation_detail(detail)
                 print("\n" + "-"*80 + "\n")
     else: